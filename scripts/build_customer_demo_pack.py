@@ -4,12 +4,23 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
+import mmap
+import os
+import shutil
+import stat
 import subprocess
 import zipfile
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 FIXED_ZIP_DT = (2020, 1, 1, 0, 0, 0)
+COPY_CHUNK_SIZE = 1 << 20
+MMAP_MIN_SIZE = 4 << 20
+# PNG and XLSX payloads are already deflate-compressed; recompressing them burns CPU for no gain.
+STORED_SUFFIXES = frozenset({".png", ".xlsx"})
 
 DEMO_FILE_ORDER = [
     Path("demo/input/messy_sales.csv"),
@@ -27,122 +38,123 @@ RUN_DEMO_WIN_ENTRY = Path("dist/run_demo.bat")
 
 
 def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[1]
-
-
-def _readme_text() -> str:
-    return (
-        "Customer Demo Pack - spreadsheet-rescue\n"
-        "========================================\n\n"
-        "This pack is designed for a 60-second buyer evaluation.\n\n"
-        "Included files and what they prove:\n"
-        "- demo/input/messy_sales.csv\n"
-        "  Realistic messy input (ambiguous dates, locale numerics, mapped headers).\n"
-        "- demo/output/Final_Report.xlsx\n"
-        "  Final client-ready workbook with Dashboard, Weekly, Top tables, Clean_Data.\n"
-        "- demo/output/qc.json\n"
-        "  Data quality warnings and rows in/out for trust and transparency.\n"
-        "- demo/output/manifest.json\n"
-        "  Run status, error code, row counts, and reproducibility metadata.\n"
-        "- demo/output/summary.txt\n"
-        "  Human-readable run summary (rows, warnings, date range, and KPIs).\n"
-        "- demo/dashboard.png\n"
-        "  KPI dashboard preview generated deterministically from workbook values.\n"
-        "- demo/clean_data.png\n"
-        "  Clean_Data sheet preview showing normalized row-level output.\n"
-        "- demo/weekly.png\n"
-        "  Weekly summary preview proving grouped reporting output.\n\n"
-        "- dist/RUN_DEMO.command\n"
-        "  macOS one-click launcher that opens workbook and proof images.\n"
-        "- dist/run_demo.bat\n"
-        "  Windows one-click launcher that opens workbook and proof images.\n\n"
-        "Delivery checklist (customer-facing):\n"
-        "- Customer provides: source file, row meaning, date style, and locale/currency.\n"
-        "- You return: Final_Report.xlsx + qc.json + manifest.json + summary.txt + proof PNGs.\n"
-        "- Turnaround: typically 24-48h for single-file cleanup.\n"
-        "- Revision policy: one clarification/revision round after first delivery.\n\n"
-        "How to regenerate:\n"
-        "1) Run ./scripts/demo.sh\n"
-        "2) Run python scripts/build_customer_demo_pack.py\n"
-    )
-
-
-def _run_demo_mac_text() -> str:
-    return (
-        "#!/usr/bin/env bash\n"
-        "set -euo pipefail\n\n"
-        'SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"\n'
-        'ROOT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"\n\n'
-        "open_file() {\n"
-        '  local target="$1"\n'
-        '  if [[ -f "$target" ]]; then\n'
-        "    if command -v open >/dev/null 2>&1; then\n"
-        '      open "$target"\n'
-        "    elif command -v xdg-open >/dev/null 2>&1; then\n"
-        '      xdg-open "$target" >/dev/null 2>&1 || true\n'
-        "    fi\n"
-        '    echo "Opened: $target"\n'
-        "  else\n"
-        '    echo "Missing: $target"\n'
-        "  fi\n"
-        "}\n\n"
-        'echo "Spreadsheet Rescue demo pack"\n'
-        'open_file "$ROOT_DIR/demo/output/Final_Report.xlsx"\n'
-        'open_file "$ROOT_DIR/demo/dashboard.png"\n'
-        'open_file "$ROOT_DIR/demo/clean_data.png"\n'
-        'open_file "$ROOT_DIR/demo/weekly.png"\n\n'
-        'echo "QC JSON: $ROOT_DIR/demo/output/qc.json"\n'
-        'echo "Manifest: $ROOT_DIR/demo/output/manifest.json"\n'
-    )
-
-
-def _run_demo_win_text() -> str:
-    return (
-        "@echo off\r\n"
-        "setlocal\r\n"
-        "set \"ROOT=%~dp0..\"\r\n"
-        "echo Spreadsheet Rescue demo pack\r\n"
-        "call :open \"%ROOT%\\demo\\output\\Final_Report.xlsx\"\r\n"
-        "call :open \"%ROOT%\\demo\\dashboard.png\"\r\n"
-        "call :open \"%ROOT%\\demo\\clean_data.png\"\r\n"
-        "call :open \"%ROOT%\\demo\\weekly.png\"\r\n"
-        "echo QC JSON: %ROOT%\\demo\\output\\qc.json\r\n"
-        "echo Manifest: %ROOT%\\demo\\output\\manifest.json\r\n"
-        "echo.\r\n"
-        "echo Press any key to close...\r\n"
-        "pause >nul\r\n"
-        "exit /b 0\r\n"
-        "\r\n"
-        ":open\r\n"
-        "if exist \"%~1\" (\r\n"
-        "  start \"\" \"%~1\"\r\n"
-        "  echo Opened: %~1\r\n"
-        ") else (\r\n"
-        "  echo Missing: %~1\r\n"
-        ")\r\n"
-        "exit /b 0\r\n"
-    )
+    return _REPO_ROOT
+
+
+_README_BYTES = (
+    b"Customer Demo Pack - spreadsheet-rescue\n"
+    b"========================================\n\n"
+    b"This pack is designed for a 60-second buyer evaluation.\n\n"
+    b"Included files and what they prove:\n"
+    b"- demo/input/messy_sales.csv\n"
+    b"  Realistic messy input (ambiguous dates, locale numerics, mapped headers).\n"
+    b"- demo/output/Final_Report.xlsx\n"
+    b"  Final client-ready workbook with Dashboard, Weekly, Top tables, Clean_Data.\n"
+    b"- demo/output/qc.json\n"
+    b"  Data quality warnings and rows in/out for trust and transparency.\n"
+    b"- demo/output/manifest.json\n"
+    b"  Run status, error code, row counts, and reproducibility metadata.\n"
+    b"- demo/output/summary.txt\n"
+    b"  Human-readable run summary (rows, warnings, date range, and KPIs).\n"
+    b"- demo/dashboard.png\n"
+    b"  KPI dashboard preview generated deterministically from workbook values.\n"
+    b"- demo/clean_data.png\n"
+    b"  Clean_Data sheet preview showing normalized row-level output.\n"
+    b"- demo/weekly.png\n"
+    b"  Weekly summary preview proving grouped reporting output.\n\n"
+    b"- dist/RUN_DEMO.command\n"
+    b"  macOS one-click launcher that opens workbook and proof images.\n"
+    b"- dist/run_demo.bat\n"
+    b"  Windows one-click launcher that opens workbook and proof images.\n\n"
+    b"Delivery checklist (customer-facing):\n"
+    b"- Customer provides: source file, row meaning, date style, and locale/currency.\n"
+    b"- You return: Final_Report.xlsx + qc.json + manifest.json + summary.txt + proof PNGs.\n"
+    b"- Turnaround: typically 24-48h for single-file cleanup.\n"
+    b"- Revision policy: one clarification/revision round after first delivery.\n\n"
+    b"How to regenerate:\n"
+    b"1) Run ./scripts/demo.sh\n"
+    b"2) Run python scripts/build_customer_demo_pack.py\n"
+)
+
+
+_RUN_DEMO_MAC_BYTES = (
+    b"#!/usr/bin/env bash\n"
+    b"set -euo pipefail\n\n"
+    b'SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"\n'
+    b'ROOT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"\n\n'
+    b"open_file() {\n"
+    b'  local target="$1"\n'
+    b'  if [[ -f "$target" ]]; then\n'
+    b"    if command -v open >/dev/null 2>&1; then\n"
+    b'      open "$target"\n'
+    b"    elif command -v xdg-open >/dev/null 2>&1; then\n"
+    b'      xdg-open "$target" >/dev/null 2>&1 || true\n'
+    b"    fi\n"
+    b'    echo "Opened: $target"\n'
+    b"  else\n"
+    b'    echo "Missing: $target"\n'
+    b"  fi\n"
+    b"}\n\n"
+    b'echo "Spreadsheet Rescue demo pack"\n'
+    b'open_file "$ROOT_DIR/demo/output/Final_Report.xlsx"\n'
+    b'open_file "$ROOT_DIR/demo/dashboard.png"\n'
+    b'open_file "$ROOT_DIR/demo/clean_data.png"\n'
+    b'open_file "$ROOT_DIR/demo/weekly.png"\n\n'
+    b'echo "QC JSON: $ROOT_DIR/demo/output/qc.json"\n'
+    b'echo "Manifest: $ROOT_DIR/demo/output/manifest.json"\n'
+)
+
+
+_RUN_DEMO_WIN_BYTES = (
+    b"@echo off\r\n"
+    b"setlocal\r\n"
+    b"set \"ROOT=%~dp0..\"\r\n"
+    b"echo Spreadsheet Rescue demo pack\r\n"
+    b"call :open \"%ROOT%\\demo\\output\\Final_Report.xlsx\"\r\n"
+    b"call :open \"%ROOT%\\demo\\dashboard.png\"\r\n"
+    b"call :open \"%ROOT%\\demo\\clean_data.png\"\r\n"
+    b"call :open \"%ROOT%\\demo\\weekly.png\"\r\n"
+    b"echo QC JSON: %ROOT%\\demo\\output\\qc.json\r\n"
+    b"echo Manifest: %ROOT%\\demo\\output\\manifest.json\r\n"
+    b"echo.\r\n"
+    b"echo Press any key to close...\r\n"
+    b"pause >nul\r\n"
+    b"exit /b 0\r\n"
+    b"\r\n"
+    b":open\r\n"
+    b"if exist \"%~1\" (\r\n"
+    b"  start \"\" \"%~1\"\r\n"
+    b"  echo Opened: %~1\r\n"
+    b") else (\r\n"
+    b"  echo Missing: %~1\r\n"
+    b")\r\n"
+    b"exit /b 0\r\n"
+)
 
 
 def _run_demo(repo_root: Path) -> None:
     demo_script = repo_root / "scripts" / "demo.sh"
     if not demo_script.exists():
         raise FileNotFoundError(f"Demo script not found: {demo_script}")
-    subprocess.run([str(demo_script)], cwd=repo_root, check=True, text=True)
+    subprocess.run([str(demo_script)], cwd=repo_root, check=True)
 
 
 def _require_file(repo_root: Path, rel_path: Path) -> Path:
     path = repo_root / rel_path
-    if not path.exists():
-        raise FileNotFoundError(f"Missing required demo file: {path}")
-    if not path.is_file():
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Missing required demo file: {path}") from None
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Expected file but found non-file path: {path}")
     return path
 
 
-def _validate_json_payloads(repo_root: Path) -> None:
-    qc = json.loads((repo_root / "demo/output/qc.json").read_text(encoding="utf-8"))
-    manifest = json.loads((repo_root / "demo/output/manifest.json").read_text(encoding="utf-8"))
+def _validate_json_payloads(repo_root: Path) -> dict[str, bytes]:
+    qc_bytes = (repo_root / "demo/output/qc.json").read_bytes()
+    manifest_bytes = (repo_root / "demo/output/manifest.json").read_bytes()
+    qc = json.loads(qc_bytes)
+    manifest = json.loads(manifest_bytes)
 
     qc_required = {"rows_in", "rows_out", "warnings"}
     manifest_required = {"status", "error_code", "rows_in", "rows_out"}
@@ -157,6 +169,25 @@ def _validate_json_payloads(repo_root: Path) -> None:
         missing = ", ".join(sorted(missing_manifest))
         raise ValueError(f"demo/output/manifest.json missing required keys: {missing}")
 
+    return {
+        "demo/output/qc.json": qc_bytes,
+        "demo/output/manifest.json": manifest_bytes,
+    }
+
+
+def _compress_type(arcname: str) -> int:
+    if Path(arcname).suffix.lower() in STORED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _zip_info(arcname: str, mode: int) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(filename=arcname, date_time=FIXED_ZIP_DT)
+    info.compress_type = _compress_type(arcname)
+    info.external_attr = (0o100000 | mode) << 16
+    info.create_system = 3
+    return info
+
 
 def _write_zip_entry(
     zf: zipfile.ZipFile,
@@ -165,11 +196,40 @@ def _write_zip_entry(
     *,
     mode: int = 0o644,
 ) -> None:
-    info = zipfile.ZipInfo(filename=arcname, date_time=FIXED_ZIP_DT)
-    info.compress_type = zipfile.ZIP_DEFLATED
-    info.external_attr = (0o100000 | mode) << 16
-    info.create_system = 3
-    zf.writestr(info, data)
+    zf.writestr(_zip_info(arcname, mode), data)
+
+
+def _write_zip_file(
+    zf: zipfile.ZipFile,
+    arcname: str,
+    src: Path,
+    *,
+    mode: int = 0o644,
+) -> None:
+    with src.open("rb") as src_fp, zf.open(_zip_info(arcname, mode), mode="w") as dst_fp:
+        if os.fstat(src_fp.fileno()).st_size >= MMAP_MIN_SIZE:
+            # Hand the page-cache mapping straight to the writer; no userspace read copy.
+            with mmap.mmap(src_fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                dst_fp.write(mapped)
+        else:
+            shutil.copyfileobj(src_fp, dst_fp, length=COPY_CHUNK_SIZE)
+
+
+def _fingerprint_path(output_zip: Path) -> Path:
+    return output_zip.with_name(f"{output_zip.name}.fp")
+
+
+def _fingerprint(repo_root: Path, demo_files: list[Path]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    # Include this script so changes to archive layout or generated members invalidate it.
+    h.update(Path(__file__).read_bytes())
+    for rel_path in demo_files:
+        h.update(rel_path.as_posix().encode("utf-8") + b"\0")
+        with (repo_root / rel_path).open("rb") as fh:
+            for chunk in iter(lambda: fh.read(COPY_CHUNK_SIZE), b""):
+                h.update(chunk)
+        h.update(b"\0")
+    return h.hexdigest()
 
 
 def build_customer_demo_pack(
@@ -178,40 +238,71 @@ def build_customer_demo_pack(
     *,
     run_demo: bool = True,
 ) -> Path:
-    repo_root = repo_root.resolve()
-    output_zip = output_zip.resolve()
+    if not repo_root.is_absolute():
+        repo_root = repo_root.resolve()
+    if not output_zip.is_absolute():
+        output_zip = output_zip.resolve()
 
     if run_demo:
         _run_demo(repo_root)
 
-    for rel_path in DEMO_FILE_ORDER:
+    demo_files = sorted(DEMO_FILE_ORDER, key=Path.as_posix)
+    for rel_path in demo_files:
         _require_file(repo_root, rel_path)
 
-    _validate_json_payloads(repo_root)
+    json_payloads = _validate_json_payloads(repo_root)
 
-    output_zip.parent.mkdir(parents=True, exist_ok=True)
-
-    with zipfile.ZipFile(output_zip, mode="w") as zf:
-        for rel_path in DEMO_FILE_ORDER:
-            src = repo_root / rel_path
-            _write_zip_entry(zf, rel_path.as_posix(), src.read_bytes())
-        _write_zip_entry(
-            zf,
-            RUN_DEMO_MAC_ENTRY.as_posix(),
-            _run_demo_mac_text().encode("utf-8"),
-            mode=0o755,
-        )
-        _write_zip_entry(
-            zf,
-            RUN_DEMO_WIN_ENTRY.as_posix(),
-            _run_demo_win_text().encode("utf-8"),
-        )
-        _write_zip_entry(zf, README_ENTRY.as_posix(), _readme_text().encode("utf-8"))
+    # demo.sh restamps manifest.json, so only --skip-demo builds can be unchanged.
+    fingerprint = None if run_demo else _fingerprint(repo_root, demo_files)
+    fingerprint_path = _fingerprint_path(output_zip)
+    if (
+        fingerprint is not None
+        and output_zip.is_file()
+        and fingerprint_path.is_file()
+        and fingerprint_path.read_text(encoding="utf-8").strip() == fingerprint
+    ):
+        return output_zip
 
+    output_zip.parent.mkdir(parents=True, exist_ok=True)
+    fingerprint_path.unlink(missing_ok=True)
+
+    tmp_zip = output_zip.with_suffix(output_zip.suffix + ".tmp")
+    try:
+        with (
+            tmp_zip.open("wb", buffering=COPY_CHUNK_SIZE) as raw,
+            zipfile.ZipFile(raw, mode="w", allowZip64=False) as zf,
+        ):
+            for rel_path in demo_files:
+                arcname = rel_path.as_posix()
+                if arcname in json_payloads:
+                    # Archive exactly the bytes that were validated above.
+                    _write_zip_entry(zf, arcname, json_payloads[arcname])
+                else:
+                    _write_zip_file(zf, arcname, repo_root / rel_path)
+            _write_zip_entry(
+                zf,
+                RUN_DEMO_MAC_ENTRY.as_posix(),
+                _RUN_DEMO_MAC_BYTES,
+                mode=0o755,
+            )
+            _write_zip_entry(
+                zf,
+                RUN_DEMO_WIN_ENTRY.as_posix(),
+                _RUN_DEMO_WIN_BYTES,
+            )
+            _write_zip_entry(zf, README_ENTRY.as_posix(), _README_BYTES)
+        tmp_zip.replace(output_zip)
+    except BaseException:
+        tmp_zip.unlink(missing_ok=True)
+        raise
+
+    if fingerprint is not None:
+        fingerprint_path.write_text(f"{fingerprint}\n", encoding="utf-8")
     return output_zip
 
 
-def main() -> None:
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Build customer-demo-pack.zip")
     parser.add_argument(
         "--repo-root",
@@ -230,7 +321,11 @@ def main() -> None:
         action="store_true",
         help="Skip running ./scripts/demo.sh before packaging.",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
 
     out = build_customer_demo_pack(
         args.repo_root,
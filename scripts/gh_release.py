@@ -2,10 +2,13 @@
 """Create/update a GitHub release and upload the customer demo pack asset."""
 
 import argparse
+import functools
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_TAG = "v0.1.4"
 DEMO_ARTIFACTS = [
     "demo/dashboard.png",
@@ -17,29 +20,62 @@ DEMO_ARTIFACTS = [
 ]
 
 
-def _run(cmd: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, cwd=cwd, check=True, text=True)
+def _run(cmd: list[str], cwd: Path) -> subprocess.CompletedProcess[bytes]:
+    return subprocess.run(cmd, cwd=cwd, check=True)
 
 
 def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return _REPO_ROOT
 
 
-def _status_paths(repo_root: Path, paths: list[str]) -> set[str]:
+def _git_status(repo_root: Path) -> dict[str, str]:
     result = subprocess.run(
-        ["git", "status", "--porcelain", "--", *paths],
+        ["git", "status", "-z", "--porcelain", "--untracked-files=all"],
+        cwd=repo_root,
+        check=True,
+        capture_output=True,
+    )
+    fields = iter(result.stdout.decode("utf-8", errors="surrogateescape").split("\0"))
+    status: dict[str, str] = {}
+    for field in fields:
+        if not field:
+            continue
+        code, path = field[:2], field[3:]
+        if "R" in code or "C" in code:
+            next(fields, None)
+        status[path] = code
+    return status
+
+
+def _remote_tag_exists(repo_root: Path, tag: str) -> bool:
+    result = subprocess.run(
+        ["git", "ls-remote", "--tags", "--refs", "origin", f"refs/tags/{tag}"],
         cwd=repo_root,
         check=True,
         text=True,
         capture_output=True,
     )
-    dirty_paths: set[str] = set()
-    for line in result.stdout.splitlines():
-        entry = line[3:]
-        if " -> " in entry:
-            entry = entry.split(" -> ", 1)[1]
-        dirty_paths.add(entry)
-    return dirty_paths
+    return bool(result.stdout.strip())
+
+
+def _release_exists(repo_root: Path, tag: str) -> bool:
+    view = subprocess.run(
+        ["gh", "release", "view", tag],
+        cwd=repo_root,
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return view.returncode == 0
+
+
+def _preflight(repo_root: Path, tag: str) -> tuple[dict[str, str], bool, bool]:
+    # The probes are independent; overlap the git/GitHub network round-trips.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        status = pool.submit(_git_status, repo_root)
+        remote_tag = pool.submit(_remote_tag_exists, repo_root, tag)
+        release = pool.submit(_release_exists, repo_root, tag)
+        return status.result(), remote_tag.result(), release.result()
 
 
 def _restore_paths(repo_root: Path, paths: list[str]) -> None:
@@ -49,11 +85,11 @@ def _restore_paths(repo_root: Path, paths: list[str]) -> None:
         ["git", "restore", "--worktree", "--", *paths],
         cwd=repo_root,
         check=True,
-        text=True,
     )
 
 
-def main() -> None:
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Publish GitHub release with customer-demo-pack.zip"
     )
@@ -80,7 +116,11 @@ def main() -> None:
         action="store_true",
         help="Allow running with a dirty working tree.",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
 
     repo_root = _repo_root()
     notes_path = args.notes or Path(f"docs/releases/{args.tag}.md")
@@ -90,26 +130,13 @@ def main() -> None:
     if shutil.which("gh") is None:
         raise SystemExit("Error: GitHub CLI `gh` is required.")
 
-    status = subprocess.run(
-        ["git", "status", "--porcelain"],
-        cwd=repo_root,
-        check=True,
-        text=True,
-        capture_output=True,
-    )
-    if status.stdout.strip() and not args.force:
+    status, remote_tag_exists, release_exists = _preflight(repo_root, args.tag)
+    if status and not args.force:
         raise SystemExit(
             "Error: working tree is dirty. Commit/stash changes first or pass --force."
         )
 
-    remote_tag = subprocess.run(
-        ["git", "ls-remote", "--tags", "--refs", "origin", f"refs/tags/{args.tag}"],
-        cwd=repo_root,
-        check=True,
-        text=True,
-        capture_output=True,
-    )
-    if not remote_tag.stdout.strip():
+    if not remote_tag_exists:
         raise SystemExit(
             f"Error: tag {args.tag} is not on origin. Push tag before creating the release."
         )
@@ -118,10 +145,7 @@ def main() -> None:
         raise SystemExit(f"Error: release notes file not found: {notes}")
 
     if args.build_pack:
-        preexisting_demo_dirty = _status_paths(repo_root, DEMO_ARTIFACTS)
-        restore_candidates = [
-            path for path in DEMO_ARTIFACTS if path not in preexisting_demo_dirty
-        ]
+        restore_candidates = [path for path in DEMO_ARTIFACTS if path not in status]
         try:
             _run(["make", "customer-pack"], cwd=repo_root)
         finally:
@@ -133,16 +157,7 @@ def main() -> None:
             "Run `make customer-pack` or pass --build-pack."
         )
 
-    view = subprocess.run(
-        ["gh", "release", "view", args.tag],
-        cwd=repo_root,
-        check=False,
-        text=True,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-
-    if view.returncode == 0:
+    if release_exists:
         _run(
             [
                 "gh",
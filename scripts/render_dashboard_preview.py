@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 from pathlib import Path
 from typing import Any
@@ -19,15 +20,34 @@ except ImportError as exc:  # pragma: no cover - exercised via subprocess tests
     ) from exc
 
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 CANVAS_WIDTH = 1920
 CANVAS_HEIGHT = 1080
 MAX_WARNINGS = 8
-FORMULA_PREFIXES = ("=", "+", "-", "@")
+# zlib default level: output stays deterministic, a few % larger, far cheaper than 9.
+PNG_COMPRESS_LEVEL = 6
+FORMULA_PREFIXES = frozenset("=+-@")
 HEALTH_TOKEN_RE = re.compile(r"(rows in|rows out|dropped)\s*:\s*(\d+)", flags=re.IGNORECASE)
+GRID_MAX_ROW = 500
+# Labels are searched in columns A-H; their values may sit one column to the right.
+GRID_MAX_COL = 9
+FONT_SPECS: dict[str, tuple[str, int]] = {
+    "title": ("DejaVuSans-Bold.ttf", 60),
+    "subtitle": ("DejaVuSans.ttf", 30),
+    "chip": ("DejaVuSans-Bold.ttf", 30),
+    "health": ("DejaVuSans-Bold.ttf", 40),
+    "kpi_label": ("DejaVuSans-Bold.ttf", 36),
+    "kpi_value": ("DejaVuSans-Bold.ttf", 80),
+    "section": ("DejaVuSans-Bold.ttf", 52),
+    "pair_label": ("DejaVuSans-Bold.ttf", 44),
+    "pair_value": ("DejaVuSans.ttf", 52),
+    "warnings_header": ("DejaVuSans-Bold.ttf", 50),
+    "warning": ("DejaVuSans.ttf", 34),
+}
 
 
 def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return _REPO_ROOT
 
 
 def _default_workbook_path() -> Path:
@@ -52,6 +72,7 @@ def _font_path(name: str) -> Path:
     return _repo_root() / "assets" / "fonts" / name
 
 
+@functools.lru_cache(maxsize=64)
 def _load_font(name: str, size: int) -> ImageFont.FreeTypeFont:
     path = _font_path(name)
     if not path.exists():
@@ -59,11 +80,16 @@ def _load_font(name: str, size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.truetype(str(path), size=size)
 
 
+@functools.cache
+def _get_fonts() -> dict[str, ImageFont.FreeTypeFont]:
+    return {key: _load_font(name, size) for key, (name, size) in FONT_SPECS.items()}
+
+
 def _clean_text(value: Any, *, default: str = "") -> str:
     if value is None:
         return default
-    text = str(value)
-    if text.startswith("'") and len(text) > 1 and text[1] in FORMULA_PREFIXES:
+    text = value if type(value) is str else str(value)
+    if len(text) > 1 and text[0] == "'" and text[1] in FORMULA_PREFIXES:
         return text[1:]
     return text
 
@@ -89,35 +115,43 @@ def _format_int(value: Any, *, default: int = 0) -> int:
         return default
 
 
-def _find_value_next_to_label(ws: Any, label: str) -> Any:
-    for row in range(1, min(ws.max_row, 300) + 1):
-        for col in range(1, min(ws.max_column, 8) + 1):
-            cell_value = ws.cell(row=row, column=col).value
-            if _clean_text(cell_value).strip() == label:
-                return ws.cell(row=row, column=col + 1).value
-    return None
+def _read_grid(ws: Any) -> list[tuple[Any, ...]]:
+    return list(
+        ws.iter_rows(min_row=1, max_row=GRID_MAX_ROW, max_col=GRID_MAX_COL, values_only=True)
+    )
+
+
+def _grid_value(grid: list[tuple[Any, ...]], row: int, col: int) -> Any:
+    if row > len(grid) or col > len(grid[row - 1]):
+        return None
+    return grid[row - 1][col - 1]
 
 
-def _extract_health_from_legacy_notes(ws: Any, warning_count: int) -> str:
+def _index_labels(grid: list[tuple[Any, ...]]) -> dict[str, Any]:
+    labels: dict[str, Any] = {}
+    for row in grid[:300]:
+        for col, cell_value in enumerate(row[:8]):
+            label = _clean_text(cell_value).strip()
+            if label and label not in labels:
+                labels[label] = row[col + 1] if col + 1 < len(row) else None
+    return labels
+
+
+def _extract_health_from_legacy_notes(grid: list[tuple[Any, ...]], warning_count: int) -> str:
     rows_in = 0
     rows_out = 0
     dropped = 0
-    for row in range(1, min(ws.max_row, 40) + 1):
-        for col in range(1, 5):
-            text = _clean_text(ws.cell(row=row, column=col).value).strip()
-            if not text:
-                continue
-            match = HEALTH_TOKEN_RE.search(text)
-            if not match:
-                continue
-            key = match.group(1).lower()
-            value = int(match.group(2))
-            if key == "rows in":
-                rows_in = value
-            elif key == "rows out":
-                rows_out = value
-            elif key == "dropped":
-                dropped = value
+    # NUL never matches \s, so a token cannot straddle two cells.
+    notes = "\0".join(_clean_text(cell_value) for row in grid[:40] for cell_value in row[:4])
+    for match in HEALTH_TOKEN_RE.finditer(notes):
+        key = match.group(1).lower()
+        value = int(match.group(2))
+        if key == "rows in":
+            rows_in = value
+        elif key == "rows out":
+            rows_out = value
+        elif key == "dropped":
+            dropped = value
 
     if warning_count == 0:
         return f"DATA HEALTH: OK | Rows in={rows_in} out={rows_out} dropped={dropped}"
@@ -128,29 +162,35 @@ def _extract_health_from_legacy_notes(ws: Any, warning_count: int) -> str:
     )
 
 
-def _extract_warnings(ws: Any) -> list[str]:
+def _extract_warnings(grid: list[tuple[Any, ...]]) -> list[str]:
+    # Single pass over column A collecting both layouts:
+    # new layout lists warnings from A10 down to the first blank cell,
+    # legacy layout marks them with "⚠ " anywhere above "Key Metrics".
     warnings_from_new_layout: list[str] = []
-
-    # New layout: A10 downward.
-    for row in range(10, min(ws.max_row, 500) + 1):
-        value = ws.cell(row=row, column=1).value
-        if value in (None, ""):
-            break
-        warning = _clean_warning(str(value))
-        if warning:
-            warnings_from_new_layout.append(warning)
-
     warnings_from_legacy: list[str] = []
-    for row in range(1, min(ws.max_row, 500) + 1):
-        value = ws.cell(row=row, column=1).value
-        text = _clean_text(value).strip()
-        if not text:
-            continue
-        if text.startswith("⚠ "):
-            warnings_from_legacy.append(_clean_warning(text))
-        elif text == "No warnings":
-            warnings_from_legacy.append("No warnings")
-        elif text == "Key Metrics" and warnings_from_legacy:
+    scan_new_layout = True
+    scan_legacy = True
+    for idx, row in enumerate(grid):
+        value = row[0] if row else None
+
+        if scan_new_layout and idx >= 9:
+            if value in (None, ""):
+                scan_new_layout = False
+            else:
+                warning = _clean_warning(str(value))
+                if warning:
+                    warnings_from_new_layout.append(warning)
+
+        if scan_legacy:
+            text = _clean_text(value).strip()
+            if text.startswith("⚠ "):
+                warnings_from_legacy.append(_clean_warning(text))
+            elif text == "No warnings":
+                warnings_from_legacy.append("No warnings")
+            elif text == "Key Metrics" and warnings_from_legacy:
+                scan_legacy = False
+
+        if not scan_new_layout and not scan_legacy:
             break
 
     warnings = (
@@ -166,64 +206,80 @@ def _extract_warnings(ws: Any) -> list[str]:
     return warnings
 
 
-def _truncate_to_width(text: str, *, max_width: float, draw: ImageDraw.ImageDraw, font: Any) -> str:
-    if draw.textlength(text, font=font) <= max_width:
+# Text width depends only on font and string for the RGB canvas, so measure once per pair.
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_length(text: str, font: ImageFont.FreeTypeFont) -> float:
+    return _MEASURE_DRAW.textlength(text, font=font)
+
+
+def _truncate_to_width(text: str, *, max_width: float, font: ImageFont.FreeTypeFont) -> str:
+    if _text_length(text, font) <= max_width:
         return text
-    trimmed = text
-    while trimmed and draw.textlength(f"{trimmed}...", font=font) > max_width:
-        trimmed = trimmed[:-1]
-    return f"{trimmed}..." if trimmed else "..."
+    # Binary search for the longest prefix that fits alongside the ellipsis.
+    lo, hi = 0, len(text) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _text_length(f"{text[:mid]}...", font) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return f"{text[:lo]}..." if lo else "..."
 
 
 def _extract_dashboard_values(workbook_path: Path) -> dict[str, Any]:
     if not workbook_path.exists():
         raise FileNotFoundError(f"Workbook not found: {workbook_path}")
 
-    wb = load_workbook(workbook_path, data_only=True)
-    if "Dashboard" not in wb.sheetnames:
-        raise ValueError(
-            f"Workbook does not contain a 'Dashboard' sheet: {workbook_path}"
-        )
-    ws = wb["Dashboard"]
-
-    warnings = _extract_warnings(ws)
-    health = _clean_text(ws["A4"].value, default="")
+    wb = load_workbook(workbook_path, data_only=True, read_only=True)
+    try:
+        if "Dashboard" not in wb.sheetnames:
+            raise ValueError(
+                f"Workbook does not contain a 'Dashboard' sheet: {workbook_path}"
+            )
+        grid = _read_grid(wb["Dashboard"])
+    finally:
+        wb.close()
+
+    warnings = _extract_warnings(grid)
+    health = _clean_text(_grid_value(grid, 4, 1), default="")
     if "DATA HEALTH" not in health.upper():
-        health = _extract_health_from_legacy_notes(ws, len(warnings))
-
-    revenue = ws["A6"].value
-    profit = ws["C6"].value
-    margin = ws["E6"].value
-    units = ws["G6"].value
-    if revenue in (None, ""):
-        revenue = _find_value_next_to_label(ws, "Total Revenue")
-    if profit in (None, ""):
-        profit = _find_value_next_to_label(ws, "Total Profit")
-    if margin in (None, ""):
-        margin = _find_value_next_to_label(ws, "Profit Margin %")
-    if units in (None, ""):
-        units = _find_value_next_to_label(ws, "Total Units")
-
-    top_product = ws["C8"].value
-    top_region = ws["G8"].value
-    if top_product in (None, ""):
-        top_product = _find_value_next_to_label(ws, "Top Product")
-    if top_region in (None, ""):
-        top_region = _find_value_next_to_label(ws, "Top Region")
-
-    # Fallback for legacy layout where fixed cells may contain text labels/warnings.
-    if not isinstance(revenue, (int, float)):
-        revenue = _find_value_next_to_label(ws, "Total Revenue")
-    if not isinstance(profit, (int, float)):
-        profit = _find_value_next_to_label(ws, "Total Profit")
-    if not isinstance(margin, (int, float)):
-        margin = _find_value_next_to_label(ws, "Profit Margin %")
-    if not isinstance(units, (int, float)):
-        units = _find_value_next_to_label(ws, "Total Units")
+        health = _extract_health_from_legacy_notes(grid, len(warnings))
+
+    revenue = _grid_value(grid, 6, 1)
+    profit = _grid_value(grid, 6, 3)
+    margin = _grid_value(grid, 6, 5)
+    units = _grid_value(grid, 6, 7)
+    top_product = _grid_value(grid, 8, 3)
+    top_region = _grid_value(grid, 8, 7)
+
+    # Current reports fill the fixed cells; only legacy layouts need the label scan,
+    # where fixed cells may be blank or hold text labels/warnings instead of numbers.
+    needs_labels = (
+        not all(isinstance(value, (int, float)) for value in (revenue, profit, margin, units))
+        or top_product in (None, "")
+        or top_region in (None, "")
+    )
+    if needs_labels:
+        labels = _index_labels(grid)
+        if not isinstance(revenue, (int, float)):
+            revenue = labels.get("Total Revenue")
+        if not isinstance(profit, (int, float)):
+            profit = labels.get("Total Profit")
+        if not isinstance(margin, (int, float)):
+            margin = labels.get("Profit Margin %")
+        if not isinstance(units, (int, float)):
+            units = labels.get("Total Units")
+        if top_product in (None, ""):
+            top_product = labels.get("Top Product")
+        if top_region in (None, ""):
+            top_region = labels.get("Top Region")
 
     return {
-        "title": _clean_text(ws["A1"].value, default="spreadsheet-rescue — Dashboard"),
-        "generated": _clean_text(ws["A2"].value, default="Generated"),
+        "title": _clean_text(_grid_value(grid, 1, 1), default="spreadsheet-rescue — Dashboard"),
+        "generated": _clean_text(_grid_value(grid, 2, 1), default="Generated"),
         "health": health or "DATA HEALTH: N/A",
         "kpis": [
             ("Total Revenue", f"{_format_float(revenue):,.2f}"),
@@ -303,7 +359,6 @@ def _draw_health(
     rendered = _truncate_to_width(
         rendered,
         max_width=(CANVAS_WIDTH - 56) - 408,
-        draw=draw,
         font=fonts["health"],
     )
     draw.text((388, 272), rendered, font=fonts["health"], fill="#23344C", anchor="lm")
@@ -405,13 +460,12 @@ def _draw_top_drivers(
             fill="#3A5676",
             anchor="lm",
         )
-        label_width = draw.textlength(label, font=fonts["pair_label"])
+        label_width = _text_length(label, fonts["pair_label"])
         value_x = int(x1 + 20 + label_width + 18)
         available = max(20.0, float(x2 - value_x - 20))
         rendered_value = _truncate_to_width(
             value,
             max_width=available,
-            draw=draw,
             font=fonts["pair_value"],
         )
         draw.text(
@@ -446,6 +500,8 @@ def _draw_warnings(
 
     line_top = 804
     line_h = 44
+    warning_font = fonts["warning"]
+    max_width = (CANVAS_WIDTH - 56) - 98
     warnings = values["warnings"] or ["No warnings"]
     for idx, warning in enumerate(warnings):
         y1 = line_top + (idx * line_h)
@@ -458,16 +514,11 @@ def _draw_warnings(
             radius=8,
             width=2,
         )
-        rendered_warning = _truncate_to_width(
-            warning,
-            max_width=(CANVAS_WIDTH - 56) - 98,
-            draw=draw,
-            font=fonts["warning"],
-        )
+        rendered_warning = _truncate_to_width(warning, max_width=max_width, font=warning_font)
         draw.text(
             (74, y1 + (line_h // 2) - 2),
             f"• {rendered_warning}",
-            font=fonts["warning"],
+            font=warning_font,
             fill="#9A6114",
             anchor="lm",
         )
@@ -476,19 +527,7 @@ def _draw_warnings(
 def render_dashboard_preview(workbook_path: Path, output_path: Path) -> Path:
     values = _extract_dashboard_values(workbook_path)
 
-    fonts = {
-        "title": _load_font("DejaVuSans-Bold.ttf", 60),
-        "subtitle": _load_font("DejaVuSans.ttf", 30),
-        "chip": _load_font("DejaVuSans-Bold.ttf", 30),
-        "health": _load_font("DejaVuSans-Bold.ttf", 40),
-        "kpi_label": _load_font("DejaVuSans-Bold.ttf", 36),
-        "kpi_value": _load_font("DejaVuSans-Bold.ttf", 80),
-        "section": _load_font("DejaVuSans-Bold.ttf", 52),
-        "pair_label": _load_font("DejaVuSans-Bold.ttf", 44),
-        "pair_value": _load_font("DejaVuSans.ttf", 52),
-        "warnings_header": _load_font("DejaVuSans-Bold.ttf", 50),
-        "warning": _load_font("DejaVuSans.ttf", 34),
-    }
+    fonts = _get_fonts()
 
     image = Image.new("RGB", (CANVAS_WIDTH, CANVAS_HEIGHT), "#EAF0F6")
     draw = ImageDraw.Draw(image)
@@ -500,7 +539,7 @@ def render_dashboard_preview(workbook_path: Path, output_path: Path) -> Path:
     _draw_warnings(draw, values, fonts)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    image.save(output_path, format="PNG", optimize=False, compress_level=9)
+    image.save(output_path, format="PNG", optimize=False, compress_level=PNG_COMPRESS_LEVEL)
     return output_path
 
 
@@ -4,9 +4,10 @@
 from __future__ import annotations
 
 import argparse
+import functools
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from openpyxl import load_workbook
 
@@ -18,6 +19,7 @@ except ImportError as exc:  # pragma: no cover
         "Run with: uv run --with pillow python scripts/render_sheet_preview.py"
     ) from exc
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
 CANVAS_WIDTH = 1920
 CANVAS_HEIGHT_MIN = 900
 TITLE_HEIGHT = 120
@@ -27,10 +29,19 @@ SIDE_MARGIN = 56
 HEADER_HEIGHT = 56
 ROW_HEIGHT = 46
 TABLE_GAP = 30
+# zlib default level: output stays deterministic, a few % larger, far cheaper than 9.
+PNG_COMPRESS_LEVEL = 6
+FONT_SPECS: dict[str, tuple[str, int]] = {
+    "title": ("DejaVuSans-Bold.ttf", 52),
+    "subtitle": ("DejaVuSans.ttf", 28),
+    "header": ("DejaVuSans-Bold.ttf", 26),
+    "cell": ("DejaVuSans.ttf", 24),
+}
+FORMULA_PREFIXES = frozenset("=+-@")
 
 
 def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return _REPO_ROOT
 
 
 def _default_workbook_path() -> Path:
@@ -49,6 +60,7 @@ def _font_path(name: str) -> Path:
     return _repo_root() / "assets" / "fonts" / name
 
 
+@functools.lru_cache(maxsize=64)
 def _load_font(name: str, size: int) -> ImageFont.FreeTypeFont:
     path = _font_path(name)
     if not path.exists():
@@ -56,19 +68,51 @@ def _load_font(name: str, size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.truetype(str(path), size=size)
 
 
+@functools.cache
+def _get_fonts() -> dict[str, ImageFont.FreeTypeFont]:
+    return {key: _load_font(name, size) for key, (name, size) in FONT_SPECS.items()}
+
+
+def _format_text(text: str) -> str:
+    if len(text) > 1 and text[0] == "'" and text[1] in FORMULA_PREFIXES:
+        return text[1:]
+    return text
+
+
+def _format_datetime(value: datetime) -> str:
+    return value.date().isoformat()
+
+
+def _format_date(value: date) -> str:
+    return value.isoformat()
+
+
+def _format_float(value: float) -> str:
+    return f"{value:,.2f}"
+
+
+# Exact-type dispatch for the scalar types openpyxl yields; subclasses take the slow path.
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    type(None): lambda _value: "",
+    str: _format_text,
+    int: str,
+    float: _format_float,
+    datetime: _format_datetime,
+    date: _format_date,
+}
+
+
 def _format_value(value: Any) -> str:
-    if value is None:
-        return ""
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
     if isinstance(value, datetime):
-        return value.date().isoformat()
+        return _format_datetime(value)
     if isinstance(value, date):
-        return value.isoformat()
+        return _format_date(value)
     if isinstance(value, float):
-        return f"{value:,.2f}"
-    text = str(value)
-    if text.startswith("'") and len(text) > 1 and text[1] in ("=", "+", "-", "@"):
-        return text[1:]
-    return text
+        return _format_float(value)
+    return _format_text(str(value))
 
 
 def _trim_text(
@@ -80,10 +124,27 @@ def _trim_text(
 ) -> str:
     if draw.textlength(text, font=font) <= max_width:
         return text
-    trimmed = text
-    while trimmed and draw.textlength(f"{trimmed}...", font=font) > max_width:
-        trimmed = trimmed[:-1]
-    return f"{trimmed}..." if trimmed else "..."
+    # Binary search for the longest prefix that fits alongside the ellipsis.
+    lo, hi = 0, len(text) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if draw.textlength(f"{text[:mid]}...", font=font) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return f"{text[:lo]}..." if lo else "..."
+
+
+def _stripe_mask(width: int, row_count: int) -> Image.Image:
+    # Even rows are shaded edge-inclusive, matching draw.rectangle((x1, y1, x2, y2)).
+    shaded = [False] * (ROW_HEIGHT * row_count + 1)
+    for row_idx in range(0, row_count, 2):
+        y1 = row_idx * ROW_HEIGHT
+        shaded[y1 : y1 + ROW_HEIGHT + 1] = [True] * (ROW_HEIGHT + 1)
+    on = b"\xff" * width
+    off = b"\x00" * width
+    data = b"".join(on if flag else off for flag in shaded)
+    return Image.frombytes("L", (width, len(shaded)), data)
 
 
 def _extract_rows(
@@ -96,24 +157,31 @@ def _extract_rows(
     if not workbook_path.exists():
         raise FileNotFoundError(f"Workbook not found: {workbook_path}")
 
-    wb = load_workbook(workbook_path, data_only=True)
-    if sheet_name not in wb.sheetnames:
-        raise ValueError(f"Workbook does not contain '{sheet_name}' sheet: {workbook_path}")
+    wb = load_workbook(workbook_path, data_only=True, read_only=True)
+    try:
+        if sheet_name not in wb.sheetnames:
+            raise ValueError(f"Workbook does not contain '{sheet_name}' sheet: {workbook_path}")
 
-    ws = wb[sheet_name]
-    ncols = min(max_cols, ws.max_column)
+        ws = wb[sheet_name]
+        preview = list(
+            ws.iter_rows(min_row=1, max_row=max_rows + 1, max_col=max_cols, values_only=True)
+        )
+        max_column = ws.max_column
+    finally:
+        wb.close()
+
+    if max_column is None:
+        # Read-only sheets are unsized when the writer omitted <dimension>.
+        max_column = max((len(row) for row in preview), default=0)
+    ncols = min(max_cols, max_column)
     if ncols < 1:
         raise ValueError(f"Sheet has no columns: {sheet_name}")
 
-    headers = [_format_value(ws.cell(row=1, column=c).value) for c in range(1, ncols + 1)]
-
-    rows: list[list[str]] = []
-    max_row = min(ws.max_row, max_rows + 1)
-    for r in range(2, max_row + 1):
-        row = [_format_value(ws.cell(row=r, column=c).value) for c in range(1, ncols + 1)]
-        if not any(cell.strip() for cell in row):
-            continue
-        rows.append(row)
+    # iter_rows pads every row out to max_col, so slicing yields exactly ncols values.
+    header_values = preview[0] if preview else (None,) * ncols
+    headers = [_format_value(value) for value in header_values[:ncols]]
+    formatted = ([_format_value(value) for value in values[:ncols]] for values in preview[1:])
+    rows = [row for row in formatted if any(cell.strip() for cell in row)]
 
     if not rows:
         rows = [["(no rows)"] + [""] * (ncols - 1)]
@@ -146,12 +214,7 @@ def render_sheet_preview(
         TOP_MARGIN + TITLE_HEIGHT + TABLE_GAP + table_height + BOTTOM_MARGIN,
     )
 
-    fonts = {
-        "title": _load_font("DejaVuSans-Bold.ttf", 52),
-        "subtitle": _load_font("DejaVuSans.ttf", 28),
-        "header": _load_font("DejaVuSans-Bold.ttf", 26),
-        "cell": _load_font("DejaVuSans.ttf", 24),
-    }
+    fonts = _get_fonts()
 
     image = Image.new("RGB", (CANVAS_WIDTH, canvas_height), "#EDF3FA")
     draw = ImageDraw.Draw(image)
@@ -215,12 +278,18 @@ def render_sheet_preview(
             anchor="mm",
         )
 
+    image.paste(
+        "#F8FBFF",
+        (table_left, header_bottom),
+        _stripe_mask(table_right - table_left + 1, len(rows)),
+    )
+
     for row_idx, row in enumerate(rows):
         y1 = header_bottom + (row_idx * ROW_HEIGHT)
         y2 = y1 + ROW_HEIGHT
-        if row_idx % 2 == 0:
-            draw.rectangle((table_left, y1, table_right, y2), fill="#F8FBFF")
-        draw.line((table_left, y2, table_right, y2), fill="#D7E3EF", width=1)
+        # An odd row's bottom separator is covered by the next (shaded) row's stripe.
+        if row_idx % 2 == 0 or row_idx == len(rows) - 1:
+            draw.line((table_left, y2, table_right, y2), fill="#D7E3EF", width=1)
 
         for col_idx, value in enumerate(row):
             x1 = table_left + (col_idx * col_width)
@@ -239,7 +308,7 @@ def render_sheet_preview(
             )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    image.save(output_path, format="PNG", optimize=False, compress_level=9)
+    image.save(output_path, format="PNG", optimize=False, compress_level=PNG_COMPRESS_LEVEL)
     return output_path
 
 
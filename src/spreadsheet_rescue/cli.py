@@ -4,36 +4,39 @@ from __future__ import annotations
 
 import re
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table as RichTable
 
 from spreadsheet_rescue import REQUIRED_COLUMNS, __version__
-from spreadsheet_rescue.io import load_table, write_json
+from spreadsheet_rescue.io import csv_is_header_only, load_table, write_json
 from spreadsheet_rescue.models import QCReport, RunManifest
-from spreadsheet_rescue.pipeline import (
-    clean_dataframe,
-    compute_dashboard_kpis,
-    compute_top_products,
-    compute_top_regions,
-    compute_weekly,
-)
 from spreadsheet_rescue.qc import write_qc_report
-from spreadsheet_rescue.report import write_report
 from spreadsheet_rescue.utils import sha256_file, utcnow_iso
 
+# pandas and the pipeline/report modules (openpyxl) dominate import time, so
+# they are imported inside the commands and `--version` / `--help` skip them.
+if TYPE_CHECKING:
+    import pandas as pd
+
 app = typer.Typer(
     name="srescue",
     help="spreadsheet-rescue — Clean messy spreadsheets into client-ready reports.",
     add_completion=False,
     no_args_is_help=True,
 )
-console = Console()
+# Repr highlighting only shows up as colour; skip its per-print regex pass when Rich's
+# own terminal detection (which honours FORCE_COLOR and a missing stdout) rules it out.
+console = Console(highlight=Console().is_terminal)
+_WHITESPACE_RE = re.compile(r"\s+")
+# Input hashing is independent of the pandas work; hashlib releases the GIL while it runs.
+_HASH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="srescue-hash")
 
 
 class NumberLocaleOption(str, Enum):
@@ -64,7 +67,7 @@ def _version_callback(value: bool) -> None:
 
 
 def _normalize_column_name(name: object) -> str:
-    return re.sub(r"\s+", "_", str(name).strip().lower())
+    return _WHITESPACE_RE.sub("_", str(name).strip().lower())
 
 
 def _parse_column_map(raw: list[str] | None, *, quiet: bool = False) -> dict[str, str]:
@@ -73,9 +76,9 @@ def _parse_column_map(raw: list[str] | None, *, quiet: bool = False) -> dict[str
         return {}
     mapping: dict[str, str] = {}
     for item in raw:
-        if "=" not in item:
+        target, sep, source = item.partition("=")
+        if not sep:
             raise ValueError(f"Invalid --map value: {item!r}  (expected target=source)")
-        target, source = item.split("=", 1)
         target_norm = _normalize_column_name(target)
         source_norm = _normalize_column_name(source)
         if not target_norm or not source_norm:
@@ -99,24 +102,31 @@ def _load_profile_map(profile: Path | None) -> list[str]:
     except OSError as exc:
         raise ValueError(f"Cannot read profile {profile}: {exc}") from exc
 
-    lines: list[str] = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        lines.append(stripped)
-    return lines
+    return [line for line in map(str.strip, text.splitlines()) if line and line[0] != "#"]
+
+
+def _is_header_only_csv(path: Path) -> bool:
+    """Return True for a CSV with no data rows, checked without importing pandas."""
+    if path.suffix.lower() != ".csv":
+        return False
+    try:
+        return csv_is_header_only(path)
+    except OSError:
+        # Unreadable inputs are reported by load_table.
+        return False
 
 
 def _apply_column_map(df: pd.DataFrame, mapping: dict[str, str]) -> pd.DataFrame:
     """Rename columns in *df* according to *mapping* (``{source: target}``)."""
     if not mapping:
         return df
-    df = df.copy()
-    df.columns = pd.Index([_normalize_column_name(c) for c in df.columns])
-    rename = {src: tgt for src, tgt in mapping.items() if src in df.columns}
-    if rename:
-        df = df.rename(columns=rename)
+    normalized = (_normalize_column_name(c) for c in df.columns)
+    columns = [mapping.get(name, name) for name in normalized]
+    if columns == list(df.columns):
+        return df
+    # A shallow copy shares the column data; only the header index is replaced.
+    df = df.copy(deep=False)
+    df.columns = columns
     return df
 
 
@@ -158,13 +168,14 @@ def _write_manifest(
     created_at: str,
     qc: QCReport,
     *,
+    input_sha256: Future[str] | None = None,
     status: str = "success",
     error_code: int | None = None,
     error_message: str = "",
 ) -> Path:
     sha256 = ""
     try:
-        sha256 = sha256_file(input_file)
+        sha256 = input_sha256.result() if input_sha256 is not None else sha256_file(input_file)
     except OSError:
         pass
 
@@ -193,6 +204,7 @@ def _write_failure_artifacts(
     message: str,
     rows_in: int = 0,
     error_code: int = 2,
+    input_sha256: Future[str] | None = None,
 ) -> tuple[Path, Path]:
     qc = QCReport(rows_in=rows_in, rows_out=0, dropped_rows=rows_in, warnings=[message])
     qc_path = write_qc_report(out_dir, qc)
@@ -202,6 +214,7 @@ def _write_failure_artifacts(
         run_id,
         created_at,
         qc,
+        input_sha256=input_sha256,
         status="failed",
         error_code=error_code,
         error_message=message,
@@ -220,6 +233,8 @@ def _write_text_artifact(path: Path, text: str) -> Path:
 def _summary_date_range(clean_df: pd.DataFrame) -> str:
     if clean_df.empty or "date" not in clean_df.columns:
         return "N/A"
+    import pandas as pd
+
     parsed = pd.to_datetime(clean_df["date"], errors="coerce")
     parsed = parsed.dropna()
     if parsed.empty:
@@ -394,6 +409,7 @@ def run(
     echo = _printer(quiet)
     created_at = utcnow_iso()
     run_id = created_at
+    input_sha256 = _HASH_EXECUTOR.submit(sha256_file, input_file)
     out_dir.mkdir(parents=True, exist_ok=True)
     try:
         mapping = _parse_column_map(_load_profile_map(profile) + (col_map or []), quiet=quiet)
@@ -403,6 +419,7 @@ def run(
             input_file,
             run_id,
             created_at,
+            input_sha256=input_sha256,
             message=str(exc),
             error_code=2,
         )
@@ -412,23 +429,54 @@ def run(
         raise typer.Exit(code=2)
 
     if not quiet:
-        console.print(Panel(
-            f"[bold]spreadsheet-rescue[/bold] v{__version__}\n"
-            f"Input:  {input_file}\nOutput: {out_dir}",
-            title="Pipeline Start", border_style="blue",
-        ))
-        if profile:
-            console.print(f"  Using profile: {profile}")
-        if mapping:
-            console.print(f"  Column map: {mapping}")
-        console.print(
-            "  Parse mode: "
-            f"date={'DD/MM' if dayfirst else 'MM/DD'}, "
-            f"number_locale={number_locale.value}"
-        )
+        # Buffer the banner so it is written (and flushed) once, not per line.
+        with console:
+            console.print(Panel(
+                f"[bold]spreadsheet-rescue[/bold] v{__version__}\n"
+                f"Input:  {input_file}\nOutput: {out_dir}",
+                title="Pipeline Start", border_style="blue",
+            ))
+            if profile:
+                console.print(f"  Using profile: {profile}")
+            if mapping:
+                console.print(f"  Column map: {mapping}")
+            console.print(
+                "  Parse mode: "
+                f"date={'DD/MM' if dayfirst else 'MM/DD'}, "
+                f"number_locale={number_locale.value}"
+            )
 
     # ── Load ─────────────────────────────────────────────────────
     echo("[blue]>[/blue] Loading input file …")
+    if _is_header_only_csv(input_file):
+        message = "Input file has 0 rows."
+        qc_path, manifest_path = _write_failure_artifacts(
+            out_dir,
+            input_file,
+            run_id,
+            created_at,
+            input_sha256=input_sha256,
+            message=message,
+            error_code=2,
+        )
+        _err(message)
+        console.print(f"  QC report -> {qc_path}")
+        console.print(f"  Manifest  -> {manifest_path}")
+        raise typer.Exit(code=2)
+
+    import pandas as pd
+
+    from spreadsheet_rescue.pipeline import (
+        clean_dataframe,
+        compute_dashboard_kpis,
+        compute_top_products,
+        compute_top_regions,
+        compute_weekly,
+        find_missing_columns,
+        missing_columns_qc,
+    )
+    from spreadsheet_rescue.report import write_report
+
     try:
         raw_df = load_table(input_file)
     except (FileNotFoundError, ValueError, OSError) as exc:
@@ -437,6 +485,7 @@ def run(
             input_file,
             run_id,
             created_at,
+            input_sha256=input_sha256,
             message=str(exc),
             error_code=2,
         )
@@ -455,6 +504,7 @@ def run(
                 input_file,
                 run_id,
                 created_at,
+                input_sha256=input_sha256,
                 message=message,
                 error_code=2,
             )
@@ -473,6 +523,7 @@ def run(
                 input_file,
                 run_id,
                 created_at,
+                input_sha256=input_sha256,
                 message=message,
                 rows_in=len(raw_df),
                 error_code=2,
@@ -488,9 +539,14 @@ def run(
 
         # ── Clean ────────────────────────────────────────────────
         echo("[blue]>[/blue] Cleaning …")
-        clean_df, qc = clean_dataframe(
-            raw_df, dayfirst=dayfirst, number_locale=number_locale.value
-        )
+        missing = find_missing_columns(raw_df.columns)
+        if missing:
+            # Fail fast: there is nothing to clean without the required columns.
+            clean_df, qc = pd.DataFrame(), missing_columns_qc(len(raw_df), missing)
+        else:
+            clean_df, qc = clean_dataframe(
+                raw_df, dayfirst=dayfirst, number_locale=number_locale.value
+            )
 
         # Always write QC
         qc_path = write_qc_report(out_dir, qc)
@@ -507,6 +563,7 @@ def run(
                 run_id,
                 created_at,
                 qc,
+                input_sha256=input_sha256,
                 status="failed",
                 error_code=2,
                 error_message=message,
@@ -514,16 +571,18 @@ def run(
             raise typer.Exit(code=2)
 
         if not quiet:
-            for w in qc.warnings:
-                console.print(f"  [yellow]![/yellow] {w}")
-            console.print(f"  {qc.rows_out} clean rows retained")
+            lines = [f"  [yellow]![/yellow] {w}" for w in qc.warnings]
+            lines.append(f"  {qc.rows_out} clean rows retained")
+            console.print("\n".join(lines))
 
         # ── Compute KPIs ─────────────────────────────────────────
         echo("[blue]>[/blue] Computing KPIs …")
-        kpis = compute_dashboard_kpis(clean_df)
         weekly = compute_weekly(clean_df)
         top_products = compute_top_products(clean_df)
         top_regions = compute_top_regions(clean_df)
+        kpis = compute_dashboard_kpis(
+            clean_df, top_products=top_products, top_regions=top_regions
+        )
 
         # ── Write report ─────────────────────────────────────────
         echo("[blue]>[/blue] Writing Final_Report.xlsx …")
@@ -533,7 +592,9 @@ def run(
         echo(f"  Report -> {report_path}")
 
         # ── Manifest ─────────────────────────────────────────────
-        manifest_path = _write_manifest(out_dir, input_file, run_id, created_at, qc)
+        manifest_path = _write_manifest(
+            out_dir, input_file, run_id, created_at, qc, input_sha256=input_sha256
+        )
         echo(f"  Manifest -> {manifest_path}")
 
         # ── Human-readable summary ──────────────────────────────
@@ -564,6 +625,7 @@ def run(
             input_file,
             run_id,
             created_at,
+            input_sha256=input_sha256,
             message=message,
             rows_in=len(raw_df),
             error_code=1,
@@ -619,6 +681,7 @@ def validate(
     echo = _printer(quiet)
     created_at = utcnow_iso()
     run_id = created_at
+    input_sha256 = _HASH_EXECUTOR.submit(sha256_file, input_file)
     out_dir.mkdir(parents=True, exist_ok=True)
     try:
         mapping = _parse_column_map(_load_profile_map(profile) + (col_map or []), quiet=quiet)
@@ -628,6 +691,7 @@ def validate(
             input_file,
             run_id,
             created_at,
+            input_sha256=input_sha256,
             message=str(exc),
             error_code=2,
         )
@@ -637,20 +701,43 @@ def validate(
         raise typer.Exit(code=2)
 
     if not quiet:
-        console.print(Panel(
-            f"[bold]spreadsheet-rescue[/bold] v{__version__}  [dim]validate mode[/dim]\n"
-            f"Input: {input_file}",
-            title="Validate", border_style="cyan",
-        ))
-        if profile:
-            console.print(f"  Using profile: {profile}")
-        console.print(
-            "  Parse mode: "
-            f"date={'DD/MM' if dayfirst else 'MM/DD'}, "
-            f"number_locale={number_locale.value}"
-        )
+        with console:
+            console.print(Panel(
+                f"[bold]spreadsheet-rescue[/bold] v{__version__}  [dim]validate mode[/dim]\n"
+                f"Input: {input_file}",
+                title="Validate", border_style="cyan",
+            ))
+            if profile:
+                console.print(f"  Using profile: {profile}")
+            console.print(
+                "  Parse mode: "
+                f"date={'DD/MM' if dayfirst else 'MM/DD'}, "
+                f"number_locale={number_locale.value}"
+            )
 
     # ── Load ─────────────────────────────────────────────────────
+    if _is_header_only_csv(input_file):
+        message = "Input file has 0 rows."
+        qc_path, manifest_path = _write_failure_artifacts(
+            out_dir,
+            input_file,
+            run_id,
+            created_at,
+            input_sha256=input_sha256,
+            message=message,
+            error_code=2,
+        )
+        _err(message)
+        console.print(f"  QC       -> {qc_path}")
+        console.print(f"  Manifest -> {manifest_path}")
+        raise typer.Exit(code=2)
+
+    from spreadsheet_rescue.pipeline import (
+        clean_dataframe,
+        find_missing_columns,
+        missing_columns_qc,
+    )
+
     try:
         raw_df = load_table(input_file)
     except (FileNotFoundError, ValueError, OSError) as exc:
@@ -659,6 +746,7 @@ def validate(
             input_file,
             run_id,
             created_at,
+            input_sha256=input_sha256,
             message=str(exc),
             error_code=2,
         )
@@ -677,6 +765,7 @@ def validate(
                 input_file,
                 run_id,
                 created_at,
+                input_sha256=input_sha256,
                 message=message,
                 error_code=2,
             )
@@ -695,6 +784,7 @@ def validate(
                 input_file,
                 run_id,
                 created_at,
+                input_sha256=input_sha256,
                 message=message,
                 rows_in=len(raw_df),
                 error_code=2,
@@ -708,7 +798,13 @@ def validate(
             raw_df = _apply_column_map(raw_df, mapping)
 
         # ── Clean (dry) ──────────────────────────────────────────
-        _, qc = clean_dataframe(raw_df, dayfirst=dayfirst, number_locale=number_locale.value)
+        missing = find_missing_columns(raw_df.columns)
+        if missing:
+            qc = missing_columns_qc(len(raw_df), missing)
+        else:
+            _, qc = clean_dataframe(
+                raw_df, dayfirst=dayfirst, number_locale=number_locale.value
+            )
 
         # Warn if all rows dropped
         if (qc.rows_out == 0 and qc.rows_in > 0) and (not quiet):
@@ -731,6 +827,7 @@ def validate(
             run_id,
             created_at,
             qc,
+            input_sha256=input_sha256,
             status=status,
             error_code=error_code,
             error_message=error_message,
@@ -757,9 +854,10 @@ def validate(
                 tbl.add_row("Warning", f"[yellow]{w}[/yellow]")
 
             tbl.add_row("Status", status)
-            console.print(tbl)
-            console.print(f"  QC       -> {qc_path}")
-            console.print(f"  Manifest -> {manifest_path}")
+            with console:
+                console.print(tbl)
+                console.print(f"  QC       -> {qc_path}")
+                console.print(f"  Manifest -> {manifest_path}")
         else:
             console.print(f"  QC       -> {qc_path}")
             console.print(f"  Manifest -> {manifest_path}")
@@ -778,6 +876,7 @@ def validate(
             input_file,
             run_id,
             created_at,
+            input_sha256=input_sha256,
             message=message,
             rows_in=len(raw_df),
             error_code=1,
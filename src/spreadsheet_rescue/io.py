@@ -2,15 +2,56 @@
 
 from __future__ import annotations
 
+import codecs
 import json
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Callable, Literal, cast
+from typing import TYPE_CHECKING, Any, Callable, Literal, cast
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 # ── Loading ──────────────────────────────────────────────────────
 
+_ENCODING_SNIFF_BLOCK = 1 << 20
+
+
+def _sniff_csv_encoding(path: Path) -> str:
+    """Return the encoding :func:`load_table` should use for the CSV at *path*.
+
+    The whole file is run through an incremental UTF-8 decoder, which is far
+    cheaper than a parse, so the CSV is only parsed once: ``"utf-8-sig"`` if
+    it decodes cleanly (BOM optional), otherwise ``"latin-1"``, which accepts
+    any byte sequence.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(path, "rb") as fh:
+        try:
+            while block := fh.read(_ENCODING_SNIFF_BLOCK):
+                decoder.decode(block)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return "latin-1"
+    return "utf-8-sig"
+
+
+def csv_is_header_only(path: Path) -> bool:
+    """Return True if the CSV at *path* is empty or holds only a header line.
+
+    Reads no further than the first data line and needs no pandas import, so
+    zero-row inputs can be rejected before a full parse.  Files that start with
+    blank lines return False and are left to :func:`load_table`.  Lines are
+    split with universal newlines so CR-only (classic Mac) exports are not
+    mistaken for a single header line; latin-1 decodes any byte sequence.
+    """
+    with open(path, encoding="latin-1", newline=None) as fh:
+        header = fh.readline()
+        if not header:
+            return True
+        if not header.strip():
+            return False
+        return all(not line.strip() for line in fh)
+
 
 def load_table(path: Path, delimiter: str | None = None) -> pd.DataFrame:
     """Load a CSV or Excel file and return a raw DataFrame.
@@ -22,6 +63,8 @@ def load_table(path: Path, delimiter: str | None = None) -> pd.DataFrame:
     ValueError
         If the extension is not supported, or CSV decoding/parsing fails.
     """
+    import pandas as pd
+
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Input file not found: {path}")
@@ -30,26 +73,24 @@ def load_table(path: Path, delimiter: str | None = None) -> pd.DataFrame:
 
     suffix = path.suffix.lower()
     if suffix == ".csv":
-        last_exc: Exception | None = None
         sep = delimiter if delimiter else None
         engine: Literal["c", "python"] = "c" if delimiter else "python"
-        for encoding in ("utf-8-sig", "utf-8", "latin-1"):
-            try:
-                return pd.read_csv(
-                    path,
-                    dtype="string",
-                    sep=sep,
-                    engine=engine,
-                    encoding=encoding,
-                    encoding_errors="strict",
-                    na_filter=True,
-                    keep_default_na=True,
-                )
-            except (UnicodeDecodeError, pd.errors.ParserError) as exc:
-                last_exc = exc
-            except OSError as exc:
-                raise ValueError(f"Could not read CSV {path}: {exc}") from exc
-        raise ValueError(f"Could not read CSV {path} (decode or parse failed)") from last_exc
+        try:
+            encoding = _sniff_csv_encoding(path)
+            return pd.read_csv(
+                path,
+                dtype="string",
+                sep=sep,
+                engine=engine,
+                encoding=encoding,
+                encoding_errors="strict",
+                na_filter=True,
+                keep_default_na=True,
+            )
+        except (UnicodeDecodeError, pd.errors.ParserError) as exc:
+            raise ValueError(f"Could not read CSV {path} (decode or parse failed)") from exc
+        except OSError as exc:
+            raise ValueError(f"Could not read CSV {path}: {exc}") from exc
 
     if suffix in (".xlsx", ".xlsm", ".xltx", ".xltm"):
         try:
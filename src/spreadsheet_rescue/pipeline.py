@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from collections.abc import Iterable
 from typing import Any, Literal, cast
 
 import pandas as pd
@@ -16,15 +18,17 @@ from spreadsheet_rescue.models import QCReport
 _THOUSANDS_COMMA_RE = re.compile(r"^[+-]?\d{1,3}(,\d{3})+$")
 _THOUSANDS_DOT_RE = re.compile(r"^[+-]?\d{1,3}(\.\d{3})+$")
 _AMBIGUOUS_DAY_MONTH_RE = re.compile(r"^\s*(\d{1,2})[/-](\d{1,2})[/-]\d{2,4}\s*$")
+_WHITESPACE_RE = re.compile(r"\s+")
 NumberLocale = Literal["auto", "us", "eu"]
 
 
 def _normalize_header_name(name: object) -> str:
-    return re.sub(r"\s+", "_", str(name).strip().lower())
+    return _WHITESPACE_RE.sub("_", str(name).strip().lower())
 
 
 def _find_duplicate_columns(columns: pd.Index) -> list[str]:
-    return sorted({str(name) for name in columns[columns.duplicated(keep=False)]})
+    counts = Counter(map(str, columns))
+    return sorted(name for name, count in counts.items() if count > 1)
 
 
 def _normalize_headers(df: pd.DataFrame) -> pd.DataFrame:
@@ -180,6 +184,26 @@ def _coerce_numeric(s: pd.Series, *, locale: NumberLocale) -> tuple[pd.Series, i
     return pd.to_numeric(s, errors="coerce"), eu_decimal_count, ambiguous_count
 
 
+# ── Required-column checks ──────────────────────────────────────
+
+
+def find_missing_columns(columns: Iterable[object]) -> list[str]:
+    """Return the required columns absent from *columns* after header normalisation."""
+    present = {_normalize_header_name(c) for c in columns}
+    return sorted(set(REQUIRED_COLUMNS) - present)
+
+
+def missing_columns_qc(rows_in: int, missing: list[str]) -> QCReport:
+    """Return the QC report for an input that lacks the *missing* required columns."""
+    return QCReport(
+        rows_in=rows_in,
+        rows_out=0,
+        dropped_rows=rows_in,
+        missing_columns=missing,
+        warnings=[f"Missing required columns: {', '.join(missing)}"],
+    )
+
+
 # ── Main cleaning function ──────────────────────────────────────
 
 
@@ -211,14 +235,9 @@ def clean_dataframe(
         return pd.DataFrame(), qc
 
     # 2. Check required columns
-    present = set(df.columns)
-    missing = sorted(set(REQUIRED_COLUMNS) - present)
+    missing = find_missing_columns(df.columns)
     if missing:
-        qc.missing_columns = missing
-        qc.warnings.append(f"Missing required columns: {', '.join(missing)}")
-        qc.rows_out = 0
-        qc.dropped_rows = qc.rows_in
-        return pd.DataFrame(), qc
+        return pd.DataFrame(), missing_columns_qc(qc.rows_in, missing)
 
     # 3. Type coercion
     ambiguous_dates = _count_ambiguous_day_month_dates(df["date"])
@@ -330,8 +349,17 @@ def compute_top_regions(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
     )
 
 
-def compute_dashboard_kpis(df: pd.DataFrame) -> dict[str, Any]:
-    """Return a dict of top-level KPIs for the Dashboard sheet."""
+def compute_dashboard_kpis(
+    df: pd.DataFrame,
+    *,
+    top_products: pd.DataFrame | None = None,
+    top_regions: pd.DataFrame | None = None,
+) -> dict[str, Any]:
+    """Return a dict of top-level KPIs for the Dashboard sheet.
+
+    Pass the frames from :func:`compute_top_products` / :func:`compute_top_regions`
+    (when already computed for *df*) to reuse their groupbys for the top entries.
+    """
     if df.empty:
         return {
             "Total Revenue": 0,
@@ -346,12 +374,18 @@ def compute_dashboard_kpis(df: pd.DataFrame) -> dict[str, Any]:
     total_profit = float(df["profit"].sum())
     margin = round((total_profit / total_rev) * 100, 2) if total_rev else 0.0
 
-    top_product = (
-        df.groupby("product")["revenue"].sum().sort_values(ascending=False).index[0]
-    )
-    top_region = (
-        df.groupby("region")["revenue"].sum().sort_values(ascending=False).index[0]
-    )
+    if top_products is not None:
+        top_product = top_products["product"].iloc[0]
+    else:
+        top_product = (
+            df.groupby("product")["revenue"].sum().sort_values(ascending=False).index[0]
+        )
+    if top_regions is not None:
+        top_region = top_regions["region"].iloc[0]
+    else:
+        top_region = (
+            df.groupby("region")["revenue"].sum().sort_values(ascending=False).index[0]
+        )
 
     return {
         "Total Revenue": round(total_rev, 2),
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +15,7 @@ from openpyxl import load_workbook
 from typer.testing import CliRunner
 
 import spreadsheet_rescue.cli as cli_mod
+import spreadsheet_rescue.pipeline as pipeline_mod
 from spreadsheet_rescue.cli import app
 from spreadsheet_rescue.models import QCReport
 
@@ -69,6 +73,7 @@ def test_validate_pass_writes_artifacts(tmp_path: Path) -> None:
     assert manifest["rows_out"] == 1
     assert manifest["status"] == "success"
     assert manifest["error_code"] is None
+    assert manifest["sha256"] == hashlib.sha256(csv_path.read_bytes()).hexdigest()
 
 
 def test_validate_missing_columns_sets_exit_code_and_qc(tmp_path: Path) -> None:
@@ -115,6 +120,36 @@ def test_run_missing_columns_writes_qc_and_manifest(tmp_path: Path) -> None:
     assert "Missing columns: cost" in manifest["error_message"]
 
 
+def test_run_missing_columns_skips_cleaning(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    csv_path = _write_csv(
+        tmp_path,
+        "run_missing.csv",
+        "date,product,region,revenue,units\n2024-01-02,Widget,EU,20,2\n",
+    )
+    out_dir = tmp_path / "run_out"
+
+    def _fail_clean(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("clean_dataframe should not run without required columns")
+
+    monkeypatch.setattr(pipeline_mod, "clean_dataframe", _fail_clean)
+
+    result = runner.invoke(
+        app, ["run", "--input", str(csv_path), "--out-dir", str(out_dir), "--quiet"]
+    )
+
+    assert result.exit_code == 2
+    qc = json.loads((out_dir / "qc_report.json").read_text())
+    assert qc == {
+        "dropped_rows": 1,
+        "missing_columns": ["cost"],
+        "rows_in": 1,
+        "rows_out": 0,
+        "warnings": ["Missing required columns: cost"],
+    }
+
+
 def test_map_allows_renamed_headers(tmp_path: Path) -> None:
     csv_path = _write_csv(
         tmp_path,
@@ -338,6 +373,23 @@ def test_profile_with_comments_and_blanks(tmp_path: Path) -> None:
     assert result.exit_code == 0
 
 
+def test_cli_import_defers_pandas() -> None:
+    code = (
+        "import sys; import spreadsheet_rescue.cli; "
+        "print('pandas' in sys.modules, 'openpyxl' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, text=True, capture_output=True
+    )
+    assert result.stdout.strip() == "False False"
+
+
+def test_summary_date_range_works_without_running_a_command() -> None:
+    df = pd.DataFrame({"date": pd.to_datetime(["2024-01-03", "2024-01-01"])})
+
+    assert cli_mod._summary_date_range(df) == "2024-01-01 to 2024-01-03"
+
+
 def test_version_flag_prints_and_exits(tmp_path: Path) -> None:
     """Test --version flag displays version and exits."""
     result = runner.invoke(app, ["--version"])
@@ -369,7 +421,7 @@ def test_validate_passes_date_and_number_parse_flags(
         qc = QCReport(rows_in=len(df), rows_out=len(df), dropped_rows=0)
         return df, qc
 
-    monkeypatch.setattr(cli_mod, "clean_dataframe", _fake_clean)
+    monkeypatch.setattr(pipeline_mod, "clean_dataframe", _fake_clean)
 
     result = runner.invoke(
         app,
@@ -695,6 +747,42 @@ def test_empty_file_nonquiet_mode(tmp_path: Path) -> None:
     assert (out_dir / "qc_report.json").exists()
 
 
+def test_zero_byte_csv_reports_no_rows_without_loading(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    csv_path = _write_csv(tmp_path, "zero.csv", "")
+    out_dir = tmp_path / "zero_out"
+
+    def _fail_load(_: Path) -> pd.DataFrame:
+        raise AssertionError("load_table should not run for an empty CSV")
+
+    monkeypatch.setattr(cli_mod, "load_table", _fail_load)
+
+    result = runner.invoke(app, ["run", "--input", str(csv_path), "--out-dir", str(out_dir)])
+
+    assert result.exit_code == 2
+    assert "Input file has 0 rows" in result.stdout
+    _assert_failed_artifacts(out_dir, error_code=2, error_substring="Input file has 0 rows")
+
+
+@pytest.mark.parametrize("command", ["run", "validate"])
+def test_cr_only_line_endings_are_not_header_only(command: str, tmp_path: Path) -> None:
+    csv_path = tmp_path / "mac.csv"
+    csv_path.write_bytes(
+        b"date,product,region,revenue,cost,units\r"
+        b"2024-01-02,Widget,EU,20,5,2\r"
+        b"2024-01-03,Gadget,US,10,4,1\r"
+    )
+    out_dir = tmp_path / "mac_out"
+
+    result = runner.invoke(app, [command, "--input", str(csv_path), "--out-dir", str(out_dir)])
+
+    assert result.exit_code == 0, result.stdout
+    assert "Input file has 0 rows" not in result.stdout
+    manifest = json.loads((out_dir / "run_manifest.json").read_text())
+    assert manifest["rows_out"] == 2
+
+
 def test_file_not_found_error(tmp_path: Path) -> None:
     """Test non-existent input file fails gracefully."""
     out_dir = tmp_path / "out"
@@ -1011,6 +1099,22 @@ def test_apply_column_map_empty_mapping_returns_same_df() -> None:
     assert result is df
 
 
+def test_apply_column_map_renames_without_touching_input() -> None:
+    df = pd.DataFrame({" Sales ": [100], "date": ["2024-01-01"]})
+
+    result = cli_mod._apply_column_map(df, {"sales": "revenue"})
+
+    assert list(result.columns) == ["revenue", "date"]
+    assert list(df.columns) == [" Sales ", "date"]
+    assert result["revenue"].tolist() == [100]
+
+
+def test_apply_column_map_returns_same_df_when_columns_unchanged() -> None:
+    df = pd.DataFrame({"date": ["2024-01-01"], "revenue": [100]})
+    result = cli_mod._apply_column_map(df, {"sales": "revenue"})
+    assert result is df
+
+
 def test_run_nonquiet_with_profile_shows_profile_line(tmp_path: Path) -> None:
     """Test run in non-quiet mode prints the profile path when provided."""
     profile_path = tmp_path / "profile.txt"
@@ -1043,7 +1147,9 @@ def test_run_nonquiet_with_profile_shows_profile_line(tmp_path: Path) -> None:
 def test_run_load_table_value_error_exits(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     """Test run exits with code 2 if load_table raises ValueError."""
     input_path = tmp_path / "input.csv"
-    input_path.write_text("date,product,region,revenue,cost,units\n")
+    input_path.write_text(
+        "date,product,region,revenue,cost,units\n2024-01-01,Widget,US,10,5,1\n"
+    )
     out_dir = tmp_path / "run_load_error"
 
     def _raise_value_error(_: Path) -> pd.DataFrame:
@@ -1074,7 +1180,7 @@ def test_run_unexpected_internal_error_exits_with_code_1_and_artifacts(
     def _raise_runtime_error(*_args: object, **_kwargs: object) -> tuple[pd.DataFrame, QCReport]:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(cli_mod, "clean_dataframe", _raise_runtime_error)
+    monkeypatch.setattr(pipeline_mod, "clean_dataframe", _raise_runtime_error)
 
     result = runner.invoke(
         app,
@@ -1127,7 +1233,9 @@ def test_validate_load_table_value_error_exits(
 ) -> None:
     """Test validate exits with code 2 if load_table raises ValueError."""
     input_path = tmp_path / "input.csv"
-    input_path.write_text("date,product,region,revenue,cost,units\n")
+    input_path.write_text(
+        "date,product,region,revenue,cost,units\n2024-01-01,Widget,US,10,5,1\n"
+    )
     out_dir = tmp_path / "validate_load_error"
 
     def _raise_value_error(_: Path) -> pd.DataFrame:
@@ -1159,7 +1267,7 @@ def test_validate_unexpected_internal_error_exits_with_code_1_and_artifacts(
     def _raise_runtime_error(*_args: object, **_kwargs: object) -> tuple[pd.DataFrame, QCReport]:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(cli_mod, "clean_dataframe", _raise_runtime_error)
+    monkeypatch.setattr(pipeline_mod, "clean_dataframe", _raise_runtime_error)
 
     result = runner.invoke(
         app,
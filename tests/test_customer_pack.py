@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
+import mmap
 import subprocess
 import sys
 import zipfile
+import zlib
 from pathlib import Path
+from types import ModuleType
+
+import pytest
 
 PNG_1X1 = (
     b"\x89PNG\r\n\x1a\n"
@@ -157,3 +163,180 @@ def test_customer_pack_is_deterministic(tmp_path: Path) -> None:
         )
 
     assert out_a.read_bytes() == out_b.read_bytes()
+
+    with zipfile.ZipFile(out_a) as zf:
+        demo_names = [name for name in zf.namelist() if name.startswith("demo/")]
+    assert demo_names == sorted(demo_names)
+
+
+def _write_minimal_demo(repo_root: Path) -> None:
+    _write_file(repo_root / "demo/input/messy_sales.csv", b"a,b\n1,2\n" * 50)
+    _write_file(repo_root / "demo/output/Final_Report.xlsx", b"PK\x03\x04fixed-xlsx")
+    _write_file(
+        repo_root / "demo/output/qc.json",
+        b'{"rows_in": 2, "rows_out": 2, "warnings": []}',
+    )
+    _write_file(
+        repo_root / "demo/output/manifest.json",
+        b'{"status": "success", "error_code": null, "rows_in": 2, "rows_out": 2}',
+    )
+    _write_file(
+        repo_root / "demo/output/summary.txt",
+        b"spreadsheet-rescue summary\nrows_in: 2\nrows_out: 2\nwarning_count: 0\n",
+    )
+    _write_file(repo_root / "demo/dashboard.png", PNG_1X1)
+    _write_file(repo_root / "demo/clean_data.png", PNG_1X1)
+    _write_file(repo_root / "demo/weekly.png", PNG_1X1)
+
+
+def _build_pack(repo_root: Path, out_zip: Path) -> None:
+    script = Path(__file__).resolve().parent.parent / "scripts" / "build_customer_demo_pack.py"
+    subprocess.run(
+        [
+            sys.executable,
+            str(script),
+            "--repo-root",
+            str(repo_root),
+            "--output",
+            str(out_zip),
+            "--skip-demo",
+        ],
+        check=True,
+        text=True,
+        capture_output=True,
+    )
+
+
+def test_customer_pack_stores_precompressed_members(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    out_zip = tmp_path / "dist" / "customer-demo-pack.zip"
+    _write_minimal_demo(repo_root)
+
+    _build_pack(repo_root, out_zip)
+
+    assert not out_zip.with_suffix(".zip.tmp").exists()
+    with zipfile.ZipFile(out_zip) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+        assert zf.read("demo/dashboard.png") == PNG_1X1
+
+    assert infos["demo/output/Final_Report.xlsx"].compress_type == zipfile.ZIP_STORED
+    assert infos["demo/dashboard.png"].compress_type == zipfile.ZIP_STORED
+    assert infos["demo/input/messy_sales.csv"].compress_type == zipfile.ZIP_DEFLATED
+    assert infos["dist/README.txt"].compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_customer_pack_skips_rebuild_when_inputs_unchanged(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    out_zip = tmp_path / "dist" / "customer-demo-pack.zip"
+    _write_minimal_demo(repo_root)
+
+    _build_pack(repo_root, out_zip)
+    fingerprint = (tmp_path / "dist" / "customer-demo-pack.zip.fp").read_text(encoding="utf-8")
+    first_mtime = out_zip.stat().st_mtime_ns
+
+    _build_pack(repo_root, out_zip)
+    assert out_zip.stat().st_mtime_ns == first_mtime
+
+    _write_file(repo_root / "demo/output/summary.txt", b"spreadsheet-rescue summary\nchanged\n")
+    _build_pack(repo_root, out_zip)
+
+    new_fingerprint = (tmp_path / "dist" / "customer-demo-pack.zip.fp").read_text(encoding="utf-8")
+    assert new_fingerprint != fingerprint
+    with zipfile.ZipFile(out_zip) as zf:
+        assert zf.read("demo/output/summary.txt").endswith(b"changed\n")
+
+
+def _load_pack_module() -> ModuleType:
+    script = Path(__file__).resolve().parent.parent / "scripts" / "build_customer_demo_pack.py"
+    spec = importlib.util.spec_from_file_location("build_customer_demo_pack", script)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_customer_pack_with_demo_run_skips_fingerprint(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    repo_root = tmp_path / "repo"
+    out_zip = tmp_path / "dist" / "customer-demo-pack.zip"
+    _write_minimal_demo(repo_root)
+    pack = _load_pack_module()
+
+    def _fail_fingerprint(*_args: object) -> str:
+        raise AssertionError("demo runs restamp the manifest; no fingerprint expected")
+
+    monkeypatch.setattr(pack, "_run_demo", lambda _root: None)
+    monkeypatch.setattr(pack, "_fingerprint", _fail_fingerprint)
+    pack.build_customer_demo_pack(repo_root, out_zip, run_demo=True)
+
+    assert out_zip.is_file()
+    assert not (tmp_path / "dist" / "customer-demo-pack.zip.fp").exists()
+
+
+def test_customer_pack_mmap_copy_preserves_member_bytes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    repo_root = tmp_path / "repo"
+    out_zip = tmp_path / "dist" / "customer-demo-pack.zip"
+    _write_minimal_demo(repo_root)
+    csv_bytes = (repo_root / "demo/input/messy_sales.csv").read_bytes()
+    pack = _load_pack_module()
+
+    mapped_sizes: list[int] = []
+    real_mmap = pack.mmap.mmap
+
+    def _tracking_mmap(fileno: int, length: int, **kwargs: object) -> mmap.mmap:
+        mapped = real_mmap(fileno, length, **kwargs)
+        mapped_sizes.append(len(mapped))
+        return mapped
+
+    # Drop the threshold so every streamed asset takes the mmap branch.
+    monkeypatch.setattr(pack, "MMAP_MIN_SIZE", 1)
+    monkeypatch.setattr(pack.mmap, "mmap", _tracking_mmap)
+    pack.build_customer_demo_pack(repo_root, out_zip, run_demo=False)
+
+    assert len(csv_bytes) in mapped_sizes
+    with zipfile.ZipFile(out_zip) as zf:
+        assert zf.testzip() is None
+        info = zf.getinfo("demo/input/messy_sales.csv")
+        assert zf.read(info) == csv_bytes
+        assert info.CRC == zlib.crc32(csv_bytes)
+        assert zf.read("demo/dashboard.png") == PNG_1X1
+
+
+def test_customer_pack_reports_missing_file_under_non_directory(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    out_zip = tmp_path / "dist" / "customer-demo-pack.zip"
+    _write_minimal_demo(repo_root)
+    (repo_root / "demo/input/messy_sales.csv").unlink()
+    (repo_root / "demo/input").rmdir()
+    _write_file(repo_root / "demo/input", b"not a directory")
+    pack = _load_pack_module()
+
+    with pytest.raises(FileNotFoundError, match="Missing required demo file"):
+        pack.build_customer_demo_pack(repo_root, out_zip, run_demo=False)
+
+
+def test_customer_pack_failed_write_leaves_no_temp_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    repo_root = tmp_path / "repo"
+    out_zip = tmp_path / "dist" / "customer-demo-pack.zip"
+    _write_minimal_demo(repo_root)
+    pack = _load_pack_module()
+    monkeypatch.setattr(pack, "_run_demo", lambda _root: None)
+    pack.build_customer_demo_pack(repo_root, out_zip, run_demo=True)
+    previous = out_zip.read_bytes()
+
+    def _failing_write(zf: zipfile.ZipFile, arcname: str, src: Path, **_kwargs: object) -> None:
+        zf.writestr(arcname, b"partial")
+        raise OSError("read error")
+
+    monkeypatch.setattr(pack, "_write_zip_file", _failing_write)
+
+    with pytest.raises(OSError, match="read error"):
+        pack.build_customer_demo_pack(repo_root, out_zip, run_demo=True)
+
+    assert not out_zip.with_suffix(".zip.tmp").exists()
+    assert out_zip.read_bytes() == previous
@@ -6,7 +6,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from spreadsheet_rescue.io import load_table, write_json
+from spreadsheet_rescue.io import csv_is_header_only, load_table, write_json
 
 
 def test_load_table_missing_file_raises_file_not_found(tmp_path: Path) -> None:
@@ -67,11 +67,12 @@ def test_load_table_csv_with_delimiter_uses_explicit_sep_and_c_engine(
     assert calls[0]["engine"] == "c"
 
 
-def test_load_table_csv_retries_encoding_on_unicode_error(
+def test_load_table_csv_sniffs_encoding_before_single_parse(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     csv_path = tmp_path / "data.csv"
-    csv_path.write_bytes(b"x")
+    # The only non-UTF-8 byte sits past the first read block.
+    csv_path.write_bytes(b"name\n" + b"x" * (1 << 20) + b"\nAndr\xe9\n")
     expected = pd.DataFrame({"a": ["1"]})
 
     encodings: list[str] = []
@@ -81,8 +82,6 @@ def test_load_table_csv_retries_encoding_on_unicode_error(
         encoding = kwargs.get("encoding")
         assert isinstance(encoding, str)
         encodings.append(encoding)
-        if encoding in {"utf-8-sig", "utf-8"}:
-            raise UnicodeDecodeError("utf-8", b"x", 0, 1, "bad")
         return expected
 
     monkeypatch.setattr(pd, "read_csv", _fake_read_csv)
@@ -90,7 +89,7 @@ def test_load_table_csv_retries_encoding_on_unicode_error(
     result = load_table(csv_path)
 
     assert result.equals(expected)
-    assert encodings == ["utf-8-sig", "utf-8", "latin-1"]
+    assert encodings == ["latin-1"]
 
 
 def test_load_table_xlsx_uses_openpyxl(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
@@ -238,6 +237,25 @@ def test_load_table_csv_latin1_fallback_reads_non_utf_chars(tmp_path: Path) -> N
     assert result.iloc[0]["name"] == "André"
 
 
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"", True),
+        (b"date,product\n", True),
+        (b"date,product\r\n\r\n   \n", True),
+        (b"date,product\n\n2024-01-01,Widget\n", False),
+        (b"\ndate,product\n", False),
+        (b"date,product\r2024-01-01,Widget\r", False),
+        (b"date,product\r\r", True),
+    ],
+)
+def test_csv_is_header_only(tmp_path: Path, content: bytes, expected: bool) -> None:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(content)
+
+    assert csv_is_header_only(csv_path) is expected
+
+
 def test_write_json_is_atomic_and_deterministic(tmp_path: Path) -> None:
     path = tmp_path / "nested" / "artifact.json"
     payload = {
@@ -12,6 +12,7 @@ from spreadsheet_rescue.pipeline import (
     compute_top_products,
     compute_top_regions,
     compute_weekly,
+    find_missing_columns,
 )
 
 
@@ -27,6 +28,12 @@ def test_missing_required_columns_sets_consistent_qc_counts() -> None:
     assert qc.missing_columns
 
 
+def test_find_missing_columns_normalizes_headers() -> None:
+    columns = pd.Index([" Date ", "PRODUCT", "region", "Revenue", "units", "extra"])
+
+    assert find_missing_columns(columns) == ["cost"]
+
+
 def test_invalid_dates_and_numbers_generate_warnings_and_drop_rows() -> None:
     df = pd.DataFrame(
         {
@@ -180,6 +187,7 @@ def test_non_empty_aggregations_and_dashboard_kpis() -> None:
     assert kpis["Profit Margin %"] == 60.0
     assert kpis["Top Product"] == "Gadget"
     assert kpis["Top Region"] == "EU"
+    assert compute_dashboard_kpis(clean_df, top_products=products, top_regions=regions) == kpis
 
 
 def test_percent_values_emit_qc_warning_and_are_coerced() -> None:
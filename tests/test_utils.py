@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import mmap
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from spreadsheet_rescue.utils import sha256_file
+
+
+def test_sha256_file_matches_hashlib(tmp_path: Path) -> None:
+    payload = b"date,product\n2024-01-01,Widget\n" * 5000
+    path = tmp_path / "input.csv"
+    path.write_bytes(payload)
+
+    assert sha256_file(path) == hashlib.sha256(payload).hexdigest()
+
+
+def test_sha256_file_handles_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.csv"
+    path.write_bytes(b"")
+
+    assert sha256_file(path) == hashlib.sha256(b"").hexdigest()
+
+
+def test_sha256_file_falls_back_when_mmap_fails(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    payload = b"date,product\n2024-01-01,Widget\n" * 5000
+    path = tmp_path / "input.csv"
+    path.write_bytes(payload)
+
+    def _no_mmap(*_args: object, **_kwargs: object) -> mmap.mmap:
+        raise OSError(errno.ENODEV, "No such device")
+
+    monkeypatch.setattr(mmap, "mmap", _no_mmap)
+
+    assert sha256_file(path) == hashlib.sha256(payload).hexdigest()
+
+
+def test_sha256_file_reads_files_that_report_zero_size(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    payload = b"procfs-style content\n"
+    path = tmp_path / "status"
+    path.write_bytes(payload)
+    real_fstat = os.fstat
+
+    def _zero_size_fstat(fd: int) -> os.stat_result:
+        st = list(real_fstat(fd))
+        st[stat.ST_SIZE] = 0
+        return os.stat_result(st)
+
+    monkeypatch.setattr(os, "fstat", _zero_size_fstat)
+
+    assert sha256_file(path) == hashlib.sha256(payload).hexdigest()